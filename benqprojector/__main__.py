@@ -8,6 +8,7 @@ import argparse
 import asyncio
 import json
 import logging
+import random
 import sys
 from typing import Any
 
@@ -22,53 +23,65 @@ from benqprojector import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bounds of the adaptive monitor polling interval in seconds
+_MONITOR_MIN_INTERVAL = 1
+_MONITOR_MAX_INTERVAL = 8
+
 
 def _listener(command: str, data: Any):
     _LOGGER.info("%s %s", command, data)
 
 
 async def main(projector: BenQProjector, action: str):
-    if not await projector.connect(interval=1):
+    if not await projector.connect(interval=_MONITOR_MIN_INTERVAL):
         sys.exit(1)
 
     try:
         if action == "status":
             await projector.update()
 
-            _LOGGER.info("Model: %s", projector.model)
-            _LOGGER.info("Position: %s", projector.projector_position)
+            status = [
+                f"Model: {projector.model}",
+                f"Position: {projector.projector_position}",
+            ]
             if projector.power_status == projector.POWERSTATUS_OFF:
-                _LOGGER.info("Power off")
+                status.append("Power off")
             else:
-                _LOGGER.info("Power on")
+                status.append("Power on")
 
-            _LOGGER.info("Direct power on  : %s", projector.direct_power_on)
+            status.append(f"Direct power on  : {projector.direct_power_on}")
 
             if projector.lamp2_time is not None:
-                _LOGGER.info("Lamp 1 time      : %s hours", projector.lamp_time)
-                _LOGGER.info("Lamp 2 time      : %s hours", projector.lamp2_time)
+                status.append(f"Lamp 1 time      : {projector.lamp_time} hours")
+                status.append(f"Lamp 2 time      : {projector.lamp2_time} hours")
             else:
-                _LOGGER.info("Lamp time        : %s hours", projector.lamp_time)
+                status.append(f"Lamp time        : {projector.lamp_time} hours")
 
             if projector.power_status == projector.POWERSTATUS_ON:
-                _LOGGER.info("3D               : %s", projector.threed_mode)
-                _LOGGER.info("Picture mode     : %s", projector.picture_mode)
-                _LOGGER.info("Aspect ratio     : %s", projector.aspect_ratio)
-                _LOGGER.info("Brilliant color  : %s", projector.brilliant_color)
-                _LOGGER.info("Blank            : %s", projector.blank)
-                _LOGGER.info("Brightness       : %s", projector.brightness)
-                _LOGGER.info("Color value      : %s", projector.color_value)
-                _LOGGER.info("Contrast         : %s", projector.contrast)
-                _LOGGER.info("Color temperature: %s", projector.color_temperature)
-                _LOGGER.info("High altitude    : %s", projector.high_altitude)
-                _LOGGER.info("Lamp mode        : %s", projector.lamp_mode)
-                _LOGGER.info("Quick auto search: %s", projector.quick_auto_search)
-                _LOGGER.info("Sharpness        : %s", projector.sharpness)
-                _LOGGER.info("Video Source     : %s", projector.video_source)
-                _LOGGER.info("Volume           : %s", projector.volume)
-                _LOGGER.info("Muted            : %s", projector.muted)
-
-            _LOGGER.info("Supported video sources: %s", projector.video_sources)
+                status.extend(
+                    [
+                        f"3D               : {projector.threed_mode}",
+                        f"Picture mode     : {projector.picture_mode}",
+                        f"Aspect ratio     : {projector.aspect_ratio}",
+                        f"Brilliant color  : {projector.brilliant_color}",
+                        f"Blank            : {projector.blank}",
+                        f"Brightness       : {projector.brightness}",
+                        f"Color value      : {projector.color_value}",
+                        f"Contrast         : {projector.contrast}",
+                        f"Color temperature: {projector.color_temperature}",
+                        f"High altitude    : {projector.high_altitude}",
+                        f"Lamp mode        : {projector.lamp_mode}",
+                        f"Quick auto search: {projector.quick_auto_search}",
+                        f"Sharpness        : {projector.sharpness}",
+                        f"Video Source     : {projector.video_source}",
+                        f"Volume           : {projector.volume}",
+                        f"Muted            : {projector.muted}",
+                    ]
+                )
+
+            status.append(f"Supported video sources: {projector.video_sources}")
+
+            _LOGGER.info("\n".join(status))
         elif action == "on":
             if not await projector.turn_on():
                 sys.exit(1)
@@ -76,13 +89,34 @@ async def main(projector: BenQProjector, action: str):
             if not await projector.turn_off():
                 sys.exit(1)
         elif action == "monitor":
-            projector.add_listener(_listener)
+            changed = asyncio.Event()
+
+            def _monitor_listener(command: str, data: Any):
+                _listener(command, data)
+                changed.set()
+
+            projector.add_listener(_monitor_listener)
 
             for command in projector._supported_commands:
                 projector.add_listener(command=command)
 
+            # Poll often while the projector state changes and back off with jitter while
+            # the projector is idle.
+            idle_rounds = 0
             while True:
-                await asyncio.sleep(1)
+                interval = min(
+                    _MONITOR_MAX_INTERVAL, _MONITOR_MIN_INTERVAL * 2**idle_rounds
+                )
+                projector.interval = interval * random.uniform(0.8, 1.2)
+                try:
+                    async with asyncio.timeout(projector.interval):
+                        await changed.wait()
+                    changed.clear()
+                    idle_rounds = 0
+                except TimeoutError:
+                    # Stop counting once the maximum interval is reached
+                    if interval < _MONITOR_MAX_INTERVAL:
+                        idle_rounds += 1
         elif action == "examine":
             _LOGGER.info("Model: %s", projector.model)
             if projector.power_status == projector.POWERSTATUS_OFF:
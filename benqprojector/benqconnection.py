@@ -7,6 +7,8 @@ Created on 25 Aug 2023
 """
 
 import asyncio
+import contextlib
+import errno
 import logging
 import socket
 from abc import ABC, abstractmethod
@@ -21,6 +23,20 @@ _TELNET_TIMEOUT = 0.2
 
 DEFAULT_PORT = 8000
 
+# Error numbers which indicate the projector can not be reached. 64 is EHOSTDOWN on BSD/macOS
+# and 113 is EHOSTUNREACH on Linux.
+_HOST_UNAVAILABLE_ERRNOS = frozenset({64, 113, errno.EHOSTDOWN, errno.EHOSTUNREACH})
+
+
+def _log_os_error(ex: OSError) -> None:
+    """
+    Logs an unhandled OSError, the stack trace is only logged when debug logging is enabled.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.exception("Unhandled OSError errno=%s", ex.errno)
+    else:
+        logger.error("Unhandled OSError errno=%s: %s", ex.errno, ex.strerror)
+
 
 class BenQConnectionError(Exception):
     """
@@ -52,12 +68,25 @@ class BenQConnection(ABC):
         """
         raise NotImplementedError
 
+    @property
+    def read_timeout(self) -> float:
+        """
+        The default read timeout of the connection in seconds.
+        """
+        return self._read_timeout
+
     def is_open(self):
         """
         Checks if the connection is open.
         """
         return self._writer is not None
 
+    def at_eof(self) -> bool:
+        """
+        Checks if the BenQ projector closed its side of the connection.
+        """
+        return self._reader is None or self._reader.at_eof()
+
     async def close(self) -> bool:
         """
         Closes the connection to the BenQ projector.
@@ -66,17 +95,12 @@ class BenQConnection(ABC):
             return True
 
         try:
-            self._writer.close()
-            await self._writer.wait_closed()
-        except (ConnectionError, TimeoutError):
-            # logger.exception("Connection error")
-            pass
+            with contextlib.suppress(ConnectionError, TimeoutError):
+                self._writer.close()
+                await self._writer.wait_closed()
         except OSError as ex:
-            if ex.errno in [64, 113]:
-                # logger.exception("Connection error")
-                pass
-            else:
-                logger.exception("Unhandeled OSError")
+            if ex.errno not in _HOST_UNAVAILABLE_ERRNOS:
+                _log_os_error(ex)
 
         self._reader = None
         self._writer = None
@@ -92,89 +116,91 @@ class BenQConnection(ABC):
         """
         Resets the reader and drains the writer of the connection.
         """
-        await self.read(-1)
+        # Only discard the data that has already been received, reading until EOF would always
+        # wait for the full read timeout
+        while await self._run_guarded(self._reader.read, 1024, timeout=0):
+            pass
         await self._writer.drain()
         return True
 
-    async def read(self, size: int = 1) -> bytes:
+    async def _handle_os_error(self, ex: OSError) -> None:
         """
-        Read size bytes from the connection.
+        Closes the connection after an OSError and raises a BenQConnectionError if the error
+        indicates the projector can no longer be reached.
         """
-        if self._reader.at_eof():
-            return b""
-
-        try:
-            return await asyncio.wait_for(
-                self._reader.read(size), timeout=self._read_timeout
-            )
-        except asyncio.exceptions.TimeoutError:
-            return b""
-        except (ConnectionError, TimeoutError) as ex:
+        if (
+            isinstance(ex, (ConnectionError, TimeoutError))
+            or ex.errno in _HOST_UNAVAILABLE_ERRNOS
+        ):
             await self.close()
             raise BenQConnectionError(ex.strerror) from ex
-        except OSError as ex:
-            if ex.errno in [64, 113]:
-                await self.close()
-                raise BenQConnectionError(ex.strerror) from ex
-            logger.exception("Unhandeled OSError")
-            await self.close()
-
-        return b""
+        _log_os_error(ex)
+        await self.close()
 
-    async def readline(self) -> bytes:
+    async def _run_guarded(self, read, *args, timeout: float | None = None) -> bytes:
         """
-        Reads a line from the connection.
+        Calls the given reader method with a read timeout and handles connection errors.
         """
         if self._reader.at_eof():
             return b""
 
+        if timeout is None:
+            timeout = self._read_timeout
+
         try:
-            return await asyncio.wait_for(
-                self._reader.readline(), timeout=self._read_timeout
-            )
+            async with asyncio.timeout(timeout):
+                return await read(*args)
         except asyncio.exceptions.TimeoutError:
             return b""
-        except (ConnectionError, TimeoutError) as ex:
-            await self.close()
-            raise BenQConnectionError(ex.strerror) from ex
+        except asyncio.IncompleteReadError as ex:
+            logger.exception("Incomplete read")
+            if ex.partial is not None:
+                return ex.partial
         except OSError as ex:
-            if ex.errno in [64, 113]:
-                await self.close()
-                raise BenQConnectionError(ex.strerror) from ex
-            logger.exception("Unhandeled OSError")
-            await self.close()
+            await self._handle_os_error(ex)
 
         return b""
 
-    async def readuntil(self, separator=b"\n"):
+    async def read(self, size: int = 1, timeout: float | None = None) -> bytes:
         """
-        Read data until separator is found.
+        Read size bytes from the connection.
         """
-        if self._reader.at_eof():
-            return b""
+        return await self._run_guarded(self._reader.read, size, timeout=timeout)
+
+    async def read_exactly(self, size: int, timeout: float | None = None) -> bytes:
+        """
+        Read exactly size bytes from the connection.
+
+        Less bytes are returned if the timeout expires before all bytes are received.
+        """
+        if timeout is None:
+            timeout = self._read_timeout
 
+        buffer = bytearray()
         try:
-            return await asyncio.wait_for(
-                self._reader.readuntil(separator), timeout=self._read_timeout
-            )
+            async with asyncio.timeout(timeout):
+                while len(buffer) < size and not self._reader.at_eof():
+                    buffer += await self._reader.read(size - len(buffer))
         except asyncio.exceptions.TimeoutError:
-            return b""
-        except asyncio.IncompleteReadError as ex:
-            logger.exception("Incomplete read")
-            if ex.partial is not None:
-                return ex.partial
-            return b""
-        except (ConnectionError, TimeoutError) as ex:
-            await self.close()
-            raise BenQConnectionError(ex.strerror) from ex
+            pass
         except OSError as ex:
-            if ex.errno in [64, 113]:
-                await self.close()
-                raise BenQConnectionError(ex.strerror) from ex
-            logger.exception("Unhandeled OSError")
-            await self.close()
+            await self._handle_os_error(ex)
 
-        return b""
+        return bytes(buffer)
+
+    async def readline(self, timeout: float | None = None) -> bytes:
+        """
+        Reads a line from the connection.
+        """
+        return await self._run_guarded(self._reader.readline, timeout=timeout)
+
+    async def readuntil(self, separator=b"\n", timeout: float | None = None):
+        """
+        Read data until separator is found.
+        """
+        return await self._run_guarded(
+            self._reader.readuntil, separator, timeout=timeout
+        )
 
     async def write(self, data: bytes) -> int:
         """
@@ -185,15 +211,8 @@ class BenQConnection(ABC):
             await self._writer.drain()
 
             return len(data)
-        except (ConnectionError, TimeoutError) as ex:
-            await self.close()
-            raise BenQConnectionError(ex.strerror) from ex
         except OSError as ex:
-            if ex.errno in [64, 113]:
-                await self.close()
-                raise BenQConnectionError(ex.strerror) from ex
-            logger.exception("Unhandeled OSError")
-            await self.close()
+            await self._handle_os_error(ex)
 
     async def flush(self) -> None:
         """
@@ -232,6 +251,7 @@ class BenQSerialConnection(BenQConnection):
                         timeout=_SERIAL_TIMEOUT,
                     )
                 )
+                self._set_low_latency_mode()
 
             return True
         except serial.SerialException as ex:
@@ -239,6 +259,20 @@ class BenQSerialConnection(BenQConnection):
 
         return False
 
+    def _set_low_latency_mode(self) -> None:
+        """
+        Enables the low latency mode of the serial port, if supported.
+
+        USB to serial adapters like FTDI otherwise buffer received data for up to 16 ms before
+        passing it on, which delays every response.
+        """
+        serial_instance = self._writer.transport.get_extra_info("serial")
+        try:
+            serial_instance.set_low_latency_mode(True)
+            logger.debug("Low latency mode enabled")
+        except (AttributeError, NotImplementedError, ValueError) as ex:
+            logger.debug("Low latency mode not supported: %s", ex)
+
 
 class BenQTelnetConnection(BenQConnection):
     """
@@ -265,16 +299,24 @@ class BenQTelnetConnection(BenQConnection):
                     asyncio.open_connection(self._host, self._port), timeout=10
                 )
 
+                # asyncio already disables Nagle's algorithm on TCP sockets, enable keep-alive
+                # so a projector that silently dropped off the network gets detected
+                sock = self._writer.get_extra_info("socket")
+                if sock is not None:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
             return True
         except asyncio.exceptions.TimeoutError as ex:
             raise BenQConnectionTimeoutError(str(ex)) from ex
         except socket.gaierror as ex:
             raise BenQConnectionError(ex.strerror) from ex
         except OSError as ex:
-            if ex.errno in [64, 113]:
+            # Only an unreachable projector is raised, a refused connection is retried by the
+            # caller
+            if ex.errno in _HOST_UNAVAILABLE_ERRNOS:
                 await self.close()
                 raise BenQConnectionError(ex.strerror) from ex
-            logger.exception("Unhandeled OSError")
+            _log_os_error(ex)
             await self.close()
 
         return False
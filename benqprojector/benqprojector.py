@@ -7,7 +7,10 @@ Created on 27 Nov 2022
 """
 
 import asyncio
+import contextlib
+import functools
 import importlib.resources
+import inspect
 import json
 import logging
 import re
@@ -15,8 +18,8 @@ import string
 import sys
 import time
 from abc import ABC
-from datetime import datetime
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from .benqconnection import (
     DEFAULT_PORT,
@@ -30,17 +33,102 @@ logger = logging.getLogger(__name__)
 
 BAUD_RATES = [2400, 4800, 9600, 14400, 19200, 38400, 57600, 115200]
 
-RESPONSE_RE_STRICT = r"^\*([^=]*)=([^#]*)#$"
-RESPONSE_RE_LOSE = r"^\*?([^=]*)=([^#]*)#?$"
-RESPONSE_RE_STATE_ONLY = re.compile(r"^\*?()([^#]*?)#?$")
+# Matches all response formats, *command=state#, command=state and *state#, in one pass. The
+# groups are the leading *, the command (None without =), the state and the trailing #.
+RESPONSE_RE = re.compile(r"^(\*?)(?:([^=]*)=)?([^#]*)(#?)$")
+
+# Lowercased error responses
+_ILLEGAL_FORMAT_RESPONSES = frozenset({"*illegal format#", "illegal format"})
+_UNSUPPORTED_ITEM_RESPONSES = frozenset({"*unsupported item#", "unsupported item"})
+_BLOCK_ITEM_RESPONSES = frozenset({"*block item#", "block item"})
 
 WHITESPACE = string.whitespace + "\x00"
+_WHITESPACE_BYTES = WHITESPACE.encode("ascii")
 END_OF_RESPONSE = b"#\n\r\x00"
+_END_OF_RESPONSE_BYTES = frozenset(END_OF_RESPONSE)
 
 _RESPONSE_TIMEOUT = 5.0
+_PROMPT_POLL_INTERVAL = 0.05
 _CONNECTION_LOCK_TIMEOUT = 1
+# How long the power state read by update_power() is trusted by turn_on() and turn_off()
+_POWER_STATE_TTL = 2.0
+# Mute, volume and video source are polled every this many read cycles, unless a listener
+# explicitly asked for them
+_STATE_POLL_MULTIPLIER = 5
+# Minimal time between two mode probes while detecting the supported modes, the time the
+# projector took to respond counts towards this
+_DETECT_MODE_INTERVAL = 0.2
+# Bounds of the adaptive time between commands while detecting the supported commands,
+# the time is lowered while the projector keeps up and raised up to the maximum on a timeout
+_DETECT_COMMAND_MIN_INTERVAL = 0.02
+_DETECT_COMMAND_START_INTERVAL = 0.05
+_DETECT_COMMAND_MAX_INTERVAL = 0.2
+# Commands that are not probed while detecting the supported commands
+_DETECT_IGNORE_COMMANDS = frozenset(
+    {
+        "menu",
+        "up",
+        "down",
+        "left",
+        "right",
+        "enter",
+        "back",
+        "zoomi",
+        "zoomo",
+        "auto",
+        "focus",
+        "error",
+    }
+)
+
+# The state queried by update() as (command, attribute, type) tuples. A bool is True when the
+# response is "on", an int is only updated when a response is received.
+_UPDATE_COMMANDS = (
+    ("directpower", "direct_power_on", bool),
+    ("ltim", "lamp_time", int),
+    ("ltim2", "lamp2_time", int),
+)
+# The state which can only be queried when the projector is powered on or off, not when
+# powering on or off
+_UPDATE_COMMANDS_POWERED_ON_OR_OFF = (("pp", "projector_position", str),)
+# The state which can only be queried when the projector is powered on
+_UPDATE_COMMANDS_POWERED_ON = (
+    ("3d", "threed_mode", str),
+    ("appmod", "picture_mode", str),
+    ("asp", "aspect_ratio", str),
+    ("bc", "brilliant_color", bool),
+    ("blank", "blank", bool),
+    ("bri", "brightness", int),
+    ("color", "color_value", int),
+    ("con", "contrast", int),
+    ("ct", "color_temperature", str),
+    ("highaltitude", "high_altitude", bool),
+    ("lampm", "lamp_mode", str),
+    ("qas", "quick_auto_search", bool),
+    ("sharp", "sharpness", str),
+)
+
+# State which changes slowly is queried by update() at most once every this many seconds
+_SLOW_STATE_TTL = {"ltim": 60, "ltim2": 60, "pp": 60}
 
 
+@functools.lru_cache(maxsize=16)
+def _filter_supported(commands: tuple, supported_commands: frozenset | None) -> tuple:
+    """
+    Returns the (command, ...) tuples of which the command is supported.
+
+    The result only changes when the supported commands change, so it's cached.
+    """
+    if supported_commands is None:
+        return commands
+    return tuple(entry for entry in commands if entry[0] in supported_commands)
+
+
+# Translation table which replaces the characters that are not allowed in config filenames
+_MODEL_FILENAME_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not c.isalnum() and c not in "._-"}
+)
+
 background_tasks = set()
 
 
@@ -53,6 +141,54 @@ def _add_background_task(task: asyncio.Task) -> None:
     task.add_done_callback(background_tasks.discard)
 
 
+async def _sleep_remaining(since: float, interval: float) -> None:
+    """
+    Sleeps for what remains of interval seconds since the given time.monotonic() timestamp.
+    """
+    remaining = interval - (time.monotonic() - since)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config(model: str) -> Mapping[str, Any] | None:
+    """
+    Reads the config for the given model, the result is shared between all projector instances.
+
+    The config is returned read-only with its lists as tuples, so no instance can change the
+    config of the others. Returns None if there is no config for the given model.
+    """
+    model_filename = model.translate(_MODEL_FILENAME_TABLE) + ".json"
+    try:
+        with importlib.resources.open_text(
+            "benqprojector.configs", model_filename
+        ) as file:
+            config = json.load(file)
+    except FileNotFoundError:
+        return None
+
+    return MappingProxyType(
+        {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in config.items()
+        }
+    )
+
+
+def _config_to_dict(config: Mapping[str, Any] | None) -> dict[str, Any] | None:
+    """
+    Returns a copy of the given shared config as a plain dictionary with lists, so the
+    instance that owns it can use and change it like a config read from JSON.
+    """
+    if config is None:
+        return None
+
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in config.items()
+    }
+
+
 class BenQRawCommand:
     """
     BenQ Raw Command.
@@ -64,6 +200,7 @@ class BenQRawCommand:
         self._command = None
         self._action = None
         self._raw_command = raw_command
+        self._raw_command_bytes = raw_command.encode("ascii")
 
     @property
     def command(self) -> str | None:
@@ -86,6 +223,24 @@ class BenQRawCommand:
         """
         return self._raw_command
 
+    @property
+    def raw_command_bytes(self) -> bytes:
+        """
+        The raw command encoded as bytes.
+        """
+        return self._raw_command_bytes
+
+
+@functools.lru_cache(maxsize=512)
+def _build_raw_command(command: str, action: str | None) -> tuple[str, str]:
+    """
+    Returns the lowercased command and the raw command for the given command and action.
+    """
+    command = command.lower()
+    if action is None:
+        return command, f"*{command}#"
+    return command, f"*{command}={action}#"
+
 
 class BenQCommand(BenQRawCommand):
     """
@@ -95,24 +250,67 @@ class BenQCommand(BenQRawCommand):
     def __init__(self, command: str, action: str | None = "?"):
         assert command is not None
 
-        command = command.lower()
-        if action is None:
-            raw_command = f"*{command}#"
-        else:
-            raw_command = f"*{command}={action}#"
+        command, raw_command = _build_raw_command(command, action)
         super().__init__(raw_command)
 
-        self._command = command.lower()
+        self._command = command
         self._action = action
 
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def shared(cls, command: str, action: str | None = "?") -> "BenQCommand":
+        """
+        Returns a shared command for the given command and action.
+
+        Commands are immutable, so the common commands don't have to be rebuilt for every call.
+        """
+        return cls(command, action)
+
+    @classmethod
+    def query(cls, command: str) -> "BenQCommand":
+        """
+        Returns a shared command for querying the current value of the given command.
+        """
+        return cls.shared(command)
+
 
 class BenQProjectorError(Exception):
     """
     Generic BenQ Projector error.
     """
 
-    def __init__(self, command: BenQCommand | None = None):
-        self.command = command
+    # Message template, formatted once when the error is first converted to a string
+    _message: str | None = None
+    _formatted_message: str | None = None
+
+    def __init__(self, command: BenQCommand | None = None, *args):
+        # The arguments are kept in args, so the error can be copied and pickled
+        super().__init__(command, *args)
+        self._command = command
+
+    @property
+    def command(self) -> BenQCommand | None:
+        """
+        The command that caused the error.
+        """
+        return self._command
+
+    @command.setter
+    def command(self, command: BenQCommand | None):
+        self._command = command
+        self.args = (command, *self.args[1:])
+        self._formatted_message = None
+
+    def __str__(self):
+        if self._command is None or self._message is None:
+            return super().__str__()
+
+        if self._formatted_message is None:
+            self._formatted_message = self._format_message(self._command)
+        return self._formatted_message
+
+    def _format_message(self, command: BenQCommand) -> str:
+        return self._message.format(command=command.command, action=command.action)
 
 
 class BenQIllegalFormatError(BenQProjectorError):
@@ -122,8 +320,7 @@ class BenQIllegalFormatError(BenQProjectorError):
     If a command format is illegal, it will echo Illegal format.
     """
 
-    def __str__(self):
-        return f"Illegal format for command '{self.command.command}' and action '{self.command.action}'"
+    _message = "Illegal format for command '{command}' and action '{action}'"
 
 
 class BenQEmptyResponseError(BenQProjectorError):
@@ -133,8 +330,7 @@ class BenQEmptyResponseError(BenQProjectorError):
     If the response is empty.
     """
 
-    def __str__(self):
-        return f"Empty response for command '{self.command.command}' and action '{self.command.action}'"
+    _message = "Empty response for command '{command}' and action '{action}'"
 
 
 class BenQUnsupportedItemError(BenQProjectorError):
@@ -145,8 +341,7 @@ class BenQUnsupportedItemError(BenQProjectorError):
     `Unsupported item`.
     """
 
-    def __str__(self):
-        return f"Unsupported item for command '{self.command.command}' and action '{self.command.action}'"
+    _message = "Unsupported item for command '{command}' and action '{action}'"
 
 
 class BenQBlockedItemError(BenQProjectorError):
@@ -157,8 +352,7 @@ class BenQBlockedItemError(BenQProjectorError):
     `Block item`.
     """
 
-    def __str__(self):
-        return f"Block item for command '{self.command.command}' and action '{self.command.action}'"
+    _message = "Block item for command '{command}' and action '{action}'"
 
 
 class BenQInvallidResponseError(BenQProjectorError):
@@ -168,12 +362,19 @@ class BenQInvallidResponseError(BenQProjectorError):
     If the response format does not match the expected format.
     """
 
+    _message = (
+        "Invalid response for command '{command}' and action '{action}'. "
+        "response: {response}"
+    )
+
     def __init__(self, command=None, response=None):
-        super().__init__(command)
         self.response = response
+        super().__init__(command, response)
 
-    def __str__(self):
-        return f"Invalid response for command '{self.command.command}' and action '{self.command.action}'. response: {self.response}"
+    def _format_message(self, command: BenQCommand) -> str:
+        return self._message.format(
+            command=command.command, action=command.action, response=self.response
+        )
 
 
 class BenQResponseTimeoutError(BenQProjectorError, asyncio.exceptions.TimeoutError):
@@ -183,8 +384,7 @@ class BenQResponseTimeoutError(BenQProjectorError, asyncio.exceptions.TimeoutErr
     If the response takes to long to receive.
     """
 
-    def __str__(self):
-        return f"Response timeout for command '{self.command.command}' and action '{self.command.action}'"
+    _message = "Response timeout for command '{command}' and action '{action}'"
 
 
 class BenQPromptTimeoutError(BenQResponseTimeoutError):
@@ -194,8 +394,7 @@ class BenQPromptTimeoutError(BenQResponseTimeoutError):
     If the command prompt takes to long to receive.
     """
 
-    def __str__(self):
-        return f"Prompt timeout for command '{self.command.command}' and action '{self.command.action}'"
+    _message = "Prompt timeout for command '{command}' and action '{action}'"
 
 
 class BenQTooBusyError(BenQProjectorError):
@@ -205,8 +404,7 @@ class BenQTooBusyError(BenQProjectorError):
     If the connection is to busy with processing other commands.
     """
 
-    def __str__(self):
-        return f"Too busy to send '{self.command.command}' and action '{self.command.action}'"
+    _message = "Too busy to send '{command}' and action '{action}'"
 
 
 class BenQProjector(ABC):
@@ -224,7 +422,6 @@ class BenQProjector(ABC):
     _use_volume_increments = False
 
     _read_task = None
-    _loop = None
     _listeners: list[Any]
     _interval: int = None
 
@@ -266,6 +463,9 @@ class BenQProjector(ABC):
     _poweron_time = None
     _poweroff_time = None
     _power_timestamp = None
+    # The last power state response and when it was received
+    _power_response = None
+    _power_response_time = None
     direct_power_on = None
 
     lamp_time = None
@@ -283,8 +483,8 @@ class BenQProjector(ABC):
     quick_auto_search = None
     sharpness = None
 
-    # Compile regular expression to match the command response.
-    _response_re = None
+    # Only accept responses in the *command=state# format
+    _strict_validation = False
 
     # Some projectors do not echo the given command, the code tries to detect if this is the case
     _expect_command_echo = True
@@ -303,10 +503,7 @@ class BenQProjector(ABC):
         self.connection = connection
         self.model = model_hint
 
-        if strict_validation:
-            self._response_re = re.compile(RESPONSE_RE_STRICT)
-        else:
-            self._response_re = re.compile(RESPONSE_RE_LOSE)
+        self._strict_validation = strict_validation
 
         self._interactive = False
         if sys.stdin and sys.stdin.isatty() and logging.root.level == logging.INFO:
@@ -316,6 +513,8 @@ class BenQProjector(ABC):
         self._connection_lock = asyncio.Lock()
         self._listeners = []
         self._listener_commands = []
+        # When the slow changing state was last updated
+        self._state_update_times = {}
 
     def busy(self):
         """
@@ -323,41 +522,46 @@ class BenQProjector(ABC):
         """
         return self._connection_lock.locked()
 
-    def _read_config(self, model: str):
-        model_filename = (
-            "".join(c if c.isalnum() or c in "._-" else "_" for c in model) + ".json"
-        )
-        with importlib.resources.open_text(
-            "benqprojector.configs", model_filename
-        ) as file:
-            return json.load(file)
-
-        return None
-
     async def get_config(self, key):
         """
         Get the config for the given key.
-        """
-        if not self.projector_config_all:
-            self.projector_config_all = await self._loop.run_in_executor(
-                None, self._read_config, "all"
-            )
 
-        if not self.projector_config and self.model:
-            try:
-                self.projector_config = await self._loop.run_in_executor(
-                    None, self._read_config, self.model
+        Lists are returned as a copy, so the caller can't change the config of this instance.
+        """
+        loop = asyncio.get_running_loop()
+        if not self.projector_config:
+            # Use the minimal config as long as the model is not known
+            self.projector_config = _config_to_dict(
+                await loop.run_in_executor(
+                    None, _read_config, self.model if self.model else "minimal"
                 )
-            except FileNotFoundError:
-                pass
+            )
 
+        value = None
         if self.projector_config:
             value = self.projector_config.get(key)
-            if value is not None:
-                return value
 
-        # Fall back to generic config when key can not be found in configuration for model
-        return self.projector_config_all.get(key)
+        if value is None:
+            # Fall back to generic config when key can not be found in configuration for
+            # model, the generic config is only read when it's needed
+            value = (await self._get_config_all()).get(key)
+
+        if isinstance(value, list):
+            return list(value)
+        return value
+
+    async def _get_config_all(self) -> dict[str, Any]:
+        """
+        Returns the generic config, reading it if that hasn't been done yet.
+        """
+        if not self.projector_config_all:
+            self.projector_config_all = _config_to_dict(
+                await asyncio.get_running_loop().run_in_executor(
+                    None, _read_config, "all"
+                )
+            )
+
+        return self.projector_config_all
 
     async def _connect(self) -> bool:
         if not self.connected():
@@ -367,16 +571,16 @@ class BenQProjector(ABC):
 
         return self.connected()
 
-    async def connect(self, loop=None, interval: float = None) -> bool:
+    async def connect(
+        self, loop=None, interval: float = None  # pylint: disable=unused-argument
+    ) -> bool:
         """
         Connect to the BenQ projector.
+
+        The loop argument is no longer used, the running event loop is used instead.
         """
         assert interval is None or interval > 0
 
-        self._loop = loop
-        if self._loop is None:
-            self._loop = asyncio.get_event_loop()
-
         try:
             if not await self._connect():
                 return False
@@ -384,14 +588,12 @@ class BenQProjector(ABC):
             logger.error("Problem communicating with %s", self.unique_id)
             return False
 
+        # The state might have changed while not connected, query it again on the next update
+        self._state_update_times = {}
+
         if not self._init:
             return True
 
-        if not self.model:
-            self.projector_config = await self._loop.run_in_executor(
-                None, self._read_config, "minimal"
-            )
-
         if self.has_prompt is None:
             self.has_prompt = await self._detect_prompt()
 
@@ -400,7 +602,7 @@ class BenQProjector(ABC):
 
         power = None
         try:
-            power = await self._send_command(BenQCommand("pow"))
+            power = await self._send_command(BenQCommand.query("pow"))
             if power is None:
                 logger.error("Failed to retrieve projector power state.")
         except BenQPromptTimeoutError:
@@ -422,7 +624,7 @@ class BenQProjector(ABC):
         model = None
         try:
             model = await self._send_command(
-                BenQCommand("modelname"), lowercase_response=False
+                BenQCommand.query("modelname"), lowercase_response=False
             )
             assert model is not None, "Failed to retrieve projector model"
         except BenQIllegalFormatError as ex:
@@ -450,7 +652,11 @@ class BenQProjector(ABC):
             self.model = model
             self.projector_config = None
 
-        self._supported_commands = await self.get_config("commands")
+        # A frozenset, supports_command is called for every command that is sent
+        supported_commands = await self.get_config("commands")
+        self._supported_commands = (
+            frozenset(supported_commands) if supported_commands is not None else None
+        )
         self.video_sources = await self.get_config("video_sources")
         self.audio_sources = await self.get_config("audio_sources")
         self.picture_modes = await self.get_config("picture_modes")
@@ -508,12 +714,28 @@ class BenQProjector(ABC):
 
         return not self.connected()
 
+    @property
+    def interval(self) -> float | None:
+        """
+        The interval in seconds between two polls of the projector state.
+        """
+        return self._interval
+
+    @interval.setter
+    def interval(self, interval: float) -> None:
+        assert interval is not None and interval > 0
+        self._interval = interval
+
     def add_listener(self, listener=None, command: str = None):
         """
         Adds a Callback to the BenQ projector.
         """
-        if command is not None and command not in self._listener_commands:
-            self._listener_commands.append(command)
+        if command is not None:
+            # Commands are lowercase, lowercasing here keeps the read coroutine from polling
+            # the same command twice
+            command = command.lower()
+            if command not in self._listener_commands:
+                self._listener_commands.append(command)
 
         if listener is not None:
             self._listeners.append(listener)
@@ -523,12 +745,38 @@ class BenQProjector(ABC):
                 _add_background_task(self._read_task)
 
     def _forward_to_listeners(self, command: str, data: Any | None):
+        """
+        Schedules the listeners on the event loop so slow listeners don't delay polling.
+
+        Listeners should not block, coroutine listeners are run as background tasks.
+        """
+        if not self._listeners:
+            return
+
+        loop = asyncio.get_running_loop()
         for listener in self._listeners:
-            try:
-                listener(command, data)
-            # pylint: disable=broad-exception-caught
-            except Exception:
-                logger.exception("Exception in listener: %s", listener)
+            if inspect.iscoroutinefunction(listener):
+                _add_background_task(
+                    asyncio.create_task(self._await_listener(listener, command, data))
+                )
+            else:
+                loop.call_soon(self._call_listener, listener, command, data)
+
+    @staticmethod
+    def _call_listener(listener, command: str, data: Any | None):
+        try:
+            listener(command, data)
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            logger.exception("Exception in listener: %s", listener)
+
+    @staticmethod
+    async def _await_listener(listener, command: str, data: Any | None):
+        try:
+            await listener(command, data)
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            logger.exception("Exception in listener: %s", listener)
 
     async def _cancel_read(self) -> bool:
         if self._read_task is not None and not (
@@ -543,6 +791,7 @@ class BenQProjector(ABC):
         Reads the current status of the projector in a loop
         """
         previous_data = {}
+        state_poll_count = 0
 
         while True:
             try:
@@ -558,18 +807,31 @@ class BenQProjector(ABC):
                             previous_data["pow"] = self.power_status
 
                         if self.power_status == self.POWERSTATUS_ON:
-                            await self.update_volume()
-                            if previous_data.get("mute") != self.muted:
-                                self._forward_to_listeners("mute", self.muted)
-                                previous_data["mute"] = self.muted
-                            if previous_data.get("vol") != self.volume:
-                                self._forward_to_listeners("vol", self.volume)
-                                previous_data["vol"] = self.volume
-
-                            await self.update_video_source()
-                            if previous_data.get("sour") != self.video_source:
-                                self._forward_to_listeners("sour", self.video_source)
-                                previous_data["sour"] = self.video_source
+                            # The first cycle after the projector turned on always polls the
+                            # state
+                            poll_state = state_poll_count % _STATE_POLL_MULTIPLIER == 0
+                            state_poll_count += 1
+
+                            if (
+                                poll_state
+                                or "mute" in self._listener_commands
+                                or "vol" in self._listener_commands
+                            ):
+                                await self.update_volume()
+                                if previous_data.get("mute") != self.muted:
+                                    self._forward_to_listeners("mute", self.muted)
+                                    previous_data["mute"] = self.muted
+                                if previous_data.get("vol") != self.volume:
+                                    self._forward_to_listeners("vol", self.volume)
+                                    previous_data["vol"] = self.volume
+
+                            if poll_state or "sour" in self._listener_commands:
+                                await self.update_video_source()
+                                if previous_data.get("sour") != self.video_source:
+                                    self._forward_to_listeners(
+                                        "sour", self.video_source
+                                    )
+                                    previous_data["sour"] = self.video_source
 
                             for command in self._listener_commands:
                                 if command not in ["pow", "mute", "vol", "sour"]:
@@ -581,6 +843,7 @@ class BenQProjector(ABC):
                                         self._forward_to_listeners(command, data)
                                         previous_data[command] = data
                         else:
+                            state_poll_count = 0
                             for command in ["pp", "ltim", "ltim2"]:
                                 if (
                                     command in self._listener_commands
@@ -607,6 +870,12 @@ class BenQProjector(ABC):
             except (BrokenPipeError, ConnectionResetError, BenQConnectionError):
                 logger.error("Error communicating with BenQ projector")
                 await self._disconnect()
+                # Don't retry right away while the projector can't be reached
+                try:
+                    await asyncio.sleep(self._interval)
+                except asyncio.CancelledError:
+                    logger.debug("Read coroutine was canceled")
+                    break
 
         self._read_task = None
         logger.debug("Read coroutine stopped")
@@ -637,27 +906,38 @@ class BenQProjector(ABC):
             logger.error("Connection not available")
             return None
 
+        async with self._locked(command):
+            if command.command == "pow" and command.action != "?":
+                # The power state is about to change
+                self._power_response = None
+
+            try:
+                await self._send_raw_command(command)
+
+                raw_response = await self._read_raw_response(command)
+
+                return self._parse_response(command, raw_response, lowercase_response)
+            except BenQProjectorError as ex:
+                ex.command = command
+                raise
+            except BenQConnectionError:
+                logger.exception("Problem communicating with %s", self.unique_id)
+                return None
+
+    @contextlib.asynccontextmanager
+    async def _locked(self, command: BenQRawCommand):
+        """
+        Holds the connection lock, raises BenQTooBusyError if the lock can not be acquired in
+        time.
+        """
         try:
-            locked = await asyncio.wait_for(
-                self._connection_lock.acquire(), timeout=_CONNECTION_LOCK_TIMEOUT
-            )
-            if not locked:
-                raise BenQTooBusyError(command)
-        except asyncio.exceptions.TimeoutError as ex:
+            async with asyncio.timeout(_CONNECTION_LOCK_TIMEOUT):
+                await self._connection_lock.acquire()
+        except TimeoutError as ex:
             raise BenQTooBusyError(command) from ex
 
         try:
-            await self._send_raw_command(command.raw_command)
-
-            raw_response = await self._read_raw_response(command)
-
-            return self._parse_response(command, raw_response, lowercase_response)
-        except BenQProjectorError as ex:
-            ex.command = command
-            raise
-        except BenQConnectionError:
-            logger.exception("Problem communicating with %s", self.unique_id)
-            return None
+            yield
         finally:
             self._connection_lock.release()
 
@@ -671,7 +951,7 @@ class BenQProjector(ABC):
         logger.debug("Detecting prompt")
         await self.connection.write(b"\r")
         response = await self.connection.read(10)
-        response = response.strip(WHITESPACE.encode())
+        response = response.strip(_WHITESPACE_BYTES)
         if response == b">":
             logger.debug("Prompt detected")
             return True
@@ -685,63 +965,76 @@ class BenQProjector(ABC):
 
         if not self._has_to_wait_for_prompt:
             await self.connection.write(b"\r")
-            if await self.connection.read(1) == b"\r":
+            if await self.connection.read_exactly(1) == b"\r":
                 return True
             self._has_to_wait_for_prompt = True
             return False
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
         while True:
-            response = await self.connection.read(100)
+            # Wait at least the connection read timeout, and never less than the poll interval,
+            # so the projector isn't flooded with carriage returns, but continue as soon as data
+            # is received
+            response = await self.connection.read(
+                100, max(self.connection.read_timeout, _PROMPT_POLL_INTERVAL)
+            )
+            if response == b"" and self.connection.at_eof():
+                # The read returns immediately at EOF, stop instead of spinning until the prompt
+                # timeout
+                await self.connection.close()
+                raise BenQConnectionError("Connection closed while waiting for prompt")
+
             response = response.strip(b"\x00")
             if response == b"":
                 await self.connection.write(b"\r")
             elif response[-1:] == b">":
                 self._has_to_wait_for_prompt = False
                 return True
-            elif response.strip(WHITESPACE.encode()) == b"":
+            elif response.strip(_WHITESPACE_BYTES) == b"":
                 pass
-            elif response.strip(WHITESPACE.encode()) == b">":
+            elif response.strip(_WHITESPACE_BYTES) == b">":
                 pass
             else:
                 logger.warning("Unexpected response: %s", response)
 
-            if (datetime.now() - start_time).total_seconds() > 1:
+            if time.monotonic() - start_time > 1:
                 raise BenQPromptTimeoutError()
 
-            await asyncio.sleep(0.05)
-
         return False
 
     async def _read_response(self) -> str:
-        response = b""
-        last_response = datetime.now()
+        response = bytearray()
         while True:
-            _response = await self.connection.readuntil(self._separator)
-            if len(_response) > 0:
-                response += _response
-                if any(c in _response for c in END_OF_RESPONSE):
-                    response = response.decode(errors="ignore")
-                    # Cleanup response
-                    response = response.strip(WHITESPACE)
-                    logger.debug("Response: %s", response)
-
-                    return response
-                last_response = datetime.now()
-
-            if (datetime.now() - last_response).total_seconds() > _RESPONSE_TIMEOUT:
+            # The read returns as soon as the separator is received, an empty result means the
+            # response timed out or the connection is closed
+            _response = await self.connection.readuntil(
+                self._separator, _RESPONSE_TIMEOUT
+            )
+            if len(_response) == 0:
                 logger.warning("Timeout while waiting for response")
                 self._has_to_wait_for_prompt = True
                 raise BenQResponseTimeoutError()
 
-            logger.debug("Waiting for response")
-            await asyncio.sleep(0.05)
+            response.extend(_response)
+            if not _END_OF_RESPONSE_BYTES.isdisjoint(_response):
+                response = response.decode(errors="ignore")
+                # Cleanup response
+                response = response.strip(WHITESPACE)
+                logger.debug("Response: %s", response)
+
+                return response
 
     async def _read_raw_response(self, command: BenQCommand) -> str:
         response = None
         empty_line_count = 0
         echo_received = None
         previous_response = None
+        # Responses which are always a command echo, a query can be echoed without the prompt
+        prompt_echo = f">{command.raw_command}"
+        if command.action == "?":
+            echo_responses = (command.raw_command, prompt_echo)
+        else:
+            echo_responses = (prompt_echo,)
         while True:
             if empty_line_count > 5:
                 if self._init:
@@ -773,18 +1066,7 @@ class BenQProjector(ABC):
                 self._has_to_wait_for_prompt = True
                 continue
 
-            if (
-                command.action == "?"
-                and not echo_received
-                and response == command.raw_command
-            ):
-                # Command echo.
-                logger.debug("Command successfully sent")
-                echo_received = True
-                self._expect_command_echo = True
-                continue
-
-            if not echo_received and response == f">{command.raw_command}":
+            if not echo_received and response in echo_responses:
                 # Command echo.
                 logger.debug("Command successfully sent")
                 echo_received = True
@@ -803,51 +1085,61 @@ class BenQProjector(ABC):
 
             return response
 
-    async def _send_raw_command(self, command: str):
+    async def _send_raw_command(self, command: BenQRawCommand):
         """
         Send a raw command to the BenQ projector.
         """
         if self.has_prompt:
             await self._wait_for_prompt()
 
-        logger.debug("command %s", command)
-        await self.connection.write(f"{command}\r".encode("ascii"))
+        logger.debug("command %s", command.raw_command)
+        await self.connection.write(command.raw_command_bytes + b"\r")
 
     def _parse_response(self, command: BenQCommand, response, lowercase: bool = True):
+        # Lowercase the response once, error responses are detected case insensitive
+        lowercase_response = response.lower()
         if lowercase:
-            # Lowercase the response
-            response = response.lower()
+            response = lowercase_response
 
-        if response in ["*illegal format#", "illegal format"]:
+        if lowercase_response in _ILLEGAL_FORMAT_RESPONSES:
             if not self._interactive:
                 logger.error("Command %s illegal format", command.raw_command)
             raise BenQIllegalFormatError(command)
 
-        if response in ["*unsupported item#", "unsupported item"]:
+        if lowercase_response in _UNSUPPORTED_ITEM_RESPONSES:
             if not self._interactive:
                 logger.warning("Command %s unsupported item", command.raw_command)
             raise BenQUnsupportedItemError(command)
 
-        if response in ["*block item#", "block item"]:
+        if lowercase_response in _BLOCK_ITEM_RESPONSES:
             if not self._interactive:
                 logger.warning("Command %s blocked item", command.raw_command)
             raise BenQBlockedItemError(command)
 
-        if command.action is None:
-            matches = RESPONSE_RE_STATE_ONLY.match(response)
-        else:
-            matches = self._response_re.match(response)
-            if matches and matches.group(1).lower() != command.command:
-                raise BenQInvallidResponseError(command, response)
-            if not matches and command.command == "modelname":
+        state = None
+        if (matches := RESPONSE_RE.match(response)) is not None:
+            start, response_command, state, end = matches.groups()
+            has_command = response_command is not None and (
+                not self._strict_validation or (start == "*" and end == "#")
+            )
+            if command.action is not None and has_command:
+                if response_command.lower() != command.command:
+                    raise BenQInvallidResponseError(command, response)
+            elif command.action is not None and command.command != "modelname":
+                state = None
+            elif response_command is not None:
+                # The response only has a state, which is everything between the * and #.
                 # Some projectors only return the model name withouth the modelname command
                 # #w700* instad of #modelname=w700*
-                matches = RESPONSE_RE_STATE_ONLY.match(response)
+                if "#" in response_command:
+                    state = None
+                else:
+                    state = f"{response_command}={state}"
 
-        if not matches:
+        if state is None:
             logger.error("Unexpected response format, response: %s", response)
             raise BenQInvallidResponseError(command, response)
-        response: str = matches.group(2)
+        response: str = state
 
         # Strip any spaces from the response
         response = response.strip(WHITESPACE)
@@ -865,9 +1157,8 @@ class BenQProjector(ABC):
         response = None
 
         try:
-            response = await self._send_command(
-                BenQCommand(command, action), check_supported
-            )
+            benq_command = BenQCommand.shared(command, action)
+            response = await self._send_command(benq_command, check_supported)
         except BenQConnectionError:
             await self.connection.close()
         except BenQResponseTimeoutError:
@@ -883,34 +1174,23 @@ class BenQProjector(ABC):
         """
         command = BenQRawCommand(raw_command)
 
-        try:
-            locked = await asyncio.wait_for(
-                self._connection_lock.acquire(), timeout=_CONNECTION_LOCK_TIMEOUT
-            )
-            if not locked:
-                raise BenQTooBusyError(command)
-        except asyncio.exceptions.TimeoutError as ex:
-            raise BenQTooBusyError(command) from ex
-
         raw_response = None
 
-        try:
-            await self._send_raw_command(command.raw_command)
+        async with self._locked(command):
+            try:
+                await self._send_raw_command(command)
 
-            # Read and log the response
-            raw_response = await self._read_raw_response(command)
-            logger.debug(raw_response)
-        except BenQResponseTimeoutError:
-            await self.connection.close()
-            ex.command = command
-        except BenQProjectorError as ex:
-            ex.command = command
-            raise
-        except BenQConnectionError:
-            logger.exception("Problem communicating with %s", self.unique_id)
-            return None
-        finally:
-            self._connection_lock.release()
+                # Read and log the response
+                raw_response = await self._read_raw_response(command)
+                logger.debug(raw_response)
+            except BenQResponseTimeoutError:
+                await self.connection.close()
+            except BenQProjectorError as ex:
+                ex.command = command
+                raise
+            except BenQConnectionError:
+                logger.exception("Problem communicating with %s", self.unique_id)
+                return None
 
         return raw_response
 
@@ -928,62 +1208,61 @@ class BenQProjector(ABC):
         # Empty the current list of supported commands.
         self._supported_commands = None
         supported_commands = []
-        ignore_commands = [
-            "menu",
-            "up",
-            "down",
-            "left",
-            "right",
-            "enter",
-            "back",
-            "zoomi",
-            "zoomo",
-            "auto",
-            "focus",
-            "error",
+        # Supported commands including their blocked/timeout markers, logged once when done
+        detected_commands = []
+        candidate_commands = [
+            command
+            for command in (await self._get_config_all()).get("commands")
+            if command not in _DETECT_IGNORE_COMMANDS
         ]
+        # The time between commands adapts to how fast the projector responds, it shrinks
+        # while the projector keeps up and backs off when a response times out.
+        interval = _DETECT_COMMAND_START_INTERVAL
         # Loop through all known commands and test if a response is given.
-        for command in self.projector_config_all.get("commands"):
-            if command not in ignore_commands:
-                retries = 0
-                while True:
+        for command in candidate_commands:
+            retries = 0
+            while True:
+                try:
                     try:
-                        try:
-                            response = await self._send_command(BenQCommand(command))
-                            if response is not None:
-                                supported_commands.append(command)
-                            else:
-                                command = None
-                        except BenQBlockedItemError:
+                        response = await self._send_command(BenQCommand.query(command))
+                        interval = max(interval * 0.9, _DETECT_COMMAND_MIN_INTERVAL)
+                        if response is not None:
                             supported_commands.append(command)
-                            command = f"{command}?"
-                        except BenQResponseTimeoutError:
-                            if retries < 2:
-                                retries += 1
-                                continue
-
-                            supported_commands.append(command)
-                            command = f"{command}¿"
-
-                        if command:
-                            # A response is given, the command is supported.
-                            if self._interactive:
-                                print(f" {command}", end="", flush=True)
-                            else:
-                                logger.info("Command %s supported", command)
-                    except BenQProjectorError:
-                        pass
-                    finally:
-                        # Give the projector some time to process command
-                        await asyncio.sleep(0.2)
-                    break
+                        else:
+                            command = None
+                    except BenQBlockedItemError:
+                        supported_commands.append(command)
+                        command = f"{command}?"
+                    except BenQResponseTimeoutError:
+                        interval = min(interval * 1.5, _DETECT_COMMAND_MAX_INTERVAL)
+                        if retries < 2:
+                            retries += 1
+                            continue
+
+                        supported_commands.append(command)
+                        command = f"{command}¿"
+
+                    if command:
+                        # A response is given, the command is supported.
+                        if self._interactive:
+                            print(f" {command}", end="", flush=True)
+                        else:
+                            detected_commands.append(command)
+                except BenQProjectorError:
+                    pass
+                finally:
+                    # Give the projector some time to process command
+                    await asyncio.sleep(interval)
+                break
         # Set the list of known commands.
-        self._supported_commands = supported_commands
+        self._supported_commands = frozenset(supported_commands)
 
         if self._interactive:
             print()
+        else:
+            logger.info("Supported commands: %s", " ".join(detected_commands))
 
-        return self._supported_commands
+        return supported_commands
 
     async def _detect_modes(self, description, command, all_modes):
         """
@@ -1009,6 +1288,7 @@ class BenQProjector(ABC):
         supported_modes = []
         # Loop through all known modes and test if a response is given.
         for mode in all_modes:
+            command_time = time.monotonic()
             try:
                 try:
                     response = await self._send_command(BenQCommand(command, mode))
@@ -1032,8 +1312,9 @@ class BenQProjector(ABC):
             except BenQProjectorError:
                 pass
             finally:
-                # Give the projector some time to process command
-                await asyncio.sleep(0.2)
+                # Give the projector some time to process command, the time the projector
+                # took to respond counts towards this
+                await _sleep_remaining(command_time, _DETECT_MODE_INTERVAL)
 
         # Revert mode back to current mode
         await self.send_command(command, current_mode)
@@ -1048,7 +1329,7 @@ class BenQProjector(ABC):
         Detect which video sources are supported by the projector.
         """
         self.video_sources = await self._detect_modes(
-            "video sources", "sour", self.projector_config_all.get("video_sources")
+            "video sources", "sour", (await self._get_config_all()).get("video_sources")
         )
         return self.video_sources
 
@@ -1057,7 +1338,9 @@ class BenQProjector(ABC):
         Detect which audio sources are supported by the projector.
         """
         self.audio_sources = await self._detect_modes(
-            "audio sources", "audiosour", self.projector_config_all.get("audio_sources")
+            "audio sources",
+            "audiosour",
+            (await self._get_config_all()).get("audio_sources"),
         )
         return self.audio_sources
 
@@ -1066,7 +1349,9 @@ class BenQProjector(ABC):
         Detect which picture modes are supported by the projector.
         """
         self.picture_modes = await self._detect_modes(
-            "picture modes", "appmod", self.projector_config_all.get("picture_modes")
+            "picture modes",
+            "appmod",
+            (await self._get_config_all()).get("picture_modes"),
         )
         return self.picture_modes
 
@@ -1077,7 +1362,7 @@ class BenQProjector(ABC):
         self.color_temperatures = await self._detect_modes(
             "color temperatures",
             "ct",
-            self.projector_config_all.get("color_temperatures"),
+            (await self._get_config_all()).get("color_temperatures"),
         )
         return self.color_temperatures
 
@@ -1086,7 +1371,7 @@ class BenQProjector(ABC):
         Detect which aspect ratios are supported by the projector.
         """
         self.aspect_ratios = await self._detect_modes(
-            "aspect ratios", "asp", self.projector_config_all.get("aspect_ratios")
+            "aspect ratios", "asp", (await self._get_config_all()).get("aspect_ratios")
         )
         return self.aspect_ratios
 
@@ -1097,7 +1382,7 @@ class BenQProjector(ABC):
         self.projector_positions = await self._detect_modes(
             "projector positions",
             "pp",
-            self.projector_config_all.get("projector_positions"),
+            (await self._get_config_all()).get("projector_positions"),
         )
         return self.projector_positions
 
@@ -1106,7 +1391,7 @@ class BenQProjector(ABC):
         Detect which lamp modes are supported by the projector.
         """
         self.lamp_modes = await self._detect_modes(
-            "lamp modes", "lampm", self.projector_config_all.get("lamp_modes")
+            "lamp modes", "lampm", (await self._get_config_all()).get("lamp_modes")
         )
         return self.lamp_modes
 
@@ -1115,7 +1400,7 @@ class BenQProjector(ABC):
         Detect which 3d modes are supported by the projector.
         """
         self.threed_modes = await self._detect_modes(
-            "3d modes", "3d", self.projector_config_all.get("3d_modes")
+            "3d modes", "3d", (await self._get_config_all()).get("3d_modes")
         )
         return self.threed_modes
 
@@ -1126,10 +1411,35 @@ class BenQProjector(ABC):
         self.menu_positions = await self._detect_modes(
             "menu positions",
             "menuposition",
-            self.projector_config_all.get("menu_positions"),
+            (await self._get_config_all()).get("menu_positions"),
         )
         return self.menu_positions
 
+    async def _wait_until_ready(self, timeout: float = 2.0) -> None:
+        """
+        Waits until the projector responds to commands again, for at most timeout seconds.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while True:
+            try:
+                # The probe itself may not take longer than the time that is left either
+                async with asyncio.timeout(deadline - time.monotonic()):
+                    if await self._send_command(BenQCommand.query("pow")) is not None:
+                        return
+            except BenQProjectorError:
+                pass
+            except TimeoutError:
+                # The probe was interrupted, resynchronise on the prompt before the next command
+                self._has_to_wait_for_prompt = True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            await asyncio.sleep(min(delay, remaining))
+            delay *= 2
+
     async def detect_projector_features(self):
         """
         Detect which features are supported by the projector.
@@ -1141,23 +1451,23 @@ class BenQProjector(ABC):
         config = {}
 
         config["commands"] = await self.detect_commands()
-        await asyncio.sleep(2)  # Give the projector some time to settle
+        await self._wait_until_ready()  # Give the projector some time to settle
         config["video_sources"] = await self.detect_video_sources()
-        await asyncio.sleep(2)
+        await self._wait_until_ready()
         config["audio_sources"] = await self.detect_audio_sources()
-        await asyncio.sleep(2)
+        await self._wait_until_ready()
         config["picture_modes"] = await self.detect_picture_modes()
-        await asyncio.sleep(2)
+        await self._wait_until_ready()
         config["color_temperatures"] = await self.detect_color_temperatures()
-        await asyncio.sleep(2)
+        await self._wait_until_ready()
         config["aspect_ratios"] = await self.detect_aspect_ratios()
-        await asyncio.sleep(2)
+        await self._wait_until_ready()
         config["projector_positions"] = await self.detect_projector_positions()
-        await asyncio.sleep(2)
+        await self._wait_until_ready()
         config["lamp_modes"] = await self.detect_lamp_modes()
-        await asyncio.sleep(2)
+        await self._wait_until_ready()
         config["3d_modes"] = await self.detect_3d_modes()
-        await asyncio.sleep(2)
+        await self._wait_until_ready()
         config["menu_positions"] = await self.detect_menu_positions()
 
         return config
@@ -1167,6 +1477,8 @@ class BenQProjector(ABC):
         Update the current power state.
         """
         response = await self.send_command("pow")
+        self._power_response = response
+        self._power_response_time = time.monotonic()
         if response is None:
             if self.power_status == self.POWERSTATUS_POWERINGON:
                 logger.debug("Projector still powering on")
@@ -1181,7 +1493,7 @@ class BenQProjector(ABC):
         if response == "off":
             if (
                 self.power_status == self.POWERSTATUS_POWERINGOFF
-                and (time.time() - self._power_timestamp) <= self._poweroff_time
+                and (time.monotonic() - self._power_timestamp) <= self._poweroff_time
             ):
                 logger.debug("Projector still powering off")
             else:
@@ -1193,7 +1505,7 @@ class BenQProjector(ABC):
         if response == "on":
             if (
                 self.power_status == self.POWERSTATUS_POWERINGON
-                and (time.time() - self._power_timestamp) <= self._poweron_time
+                and (time.monotonic() - self._power_timestamp) <= self._poweron_time
             ):
                 logger.debug("Projector still powering on")
             else:
@@ -1232,6 +1544,45 @@ class BenQProjector(ABC):
             self.video_source = await self.send_command("sour")
             logger.debug("Video source: %s", self.video_source)
 
+    async def _update_state(self, commands) -> None:
+        """
+        Queries the given (command, attribute, type) tuples and updates the attributes.
+        """
+        for command, attribute, value_type in _filter_supported(
+            commands, self._supported_commands
+        ):
+            if self._is_state_fresh(command):
+                continue
+
+            response = await self.send_command(command)
+            if value_type is bool:
+                value = response == "on"
+            elif value_type is int:
+                if response is None:
+                    continue
+                try:
+                    value = int(response)
+                except ValueError:
+                    logger.error("Invalid %s response: %s", command, response)
+                    continue
+            else:
+                value = response
+
+            setattr(self, attribute, value)
+            logger.debug("%s: %s", attribute, value)
+            if response is not None and command in _SLOW_STATE_TTL:
+                self._state_update_times[command] = time.monotonic()
+
+    def _is_state_fresh(self, command: str) -> bool:
+        """
+        Checks if the state of a slow changing command was updated recently enough to skip it.
+        """
+        last_update = self._state_update_times.get(command)
+        return (
+            last_update is not None
+            and time.monotonic() - last_update < _SLOW_STATE_TTL[command]
+        )
+
     async def update(self) -> bool:
         """
         Update all known states.
@@ -1241,39 +1592,16 @@ class BenQProjector(ABC):
         if not await self.update_power():
             return False
 
-        if self.supports_command("directpower"):
-            self.direct_power_on = await self.send_command("directpower") == "on"
-            logger.debug("Direct power on: %s", self.direct_power_on)
-
-        if self.supports_command("ltim"):
-            response = await self.send_command("ltim")
-            if response is not None:
-                self.lamp_time = int(response)
-
-        if self.supports_command("ltim2"):
-            response = await self.send_command("ltim2")
-            if response is not None:
-                self.lamp2_time = int(response)
+        await self._update_state(_UPDATE_COMMANDS)
 
         if self.power_status in [self.POWERSTATUS_OFF, self.POWERSTATUS_ON]:
             # Commands which only work when powered on or off, not when
             # powering on or off
-            if self.supports_command("pp"):
-                self.projector_position = await self.send_command("pp")
+            await self._update_state(_UPDATE_COMMANDS_POWERED_ON_OR_OFF)
 
         if self.power_status in [self.POWERSTATUS_POWERINGOFF, self.POWERSTATUS_OFF]:
-            self.threed_mode = None
-            self.picture_mode = None
-            self.aspect_ratio = None
-            self.brilliant_color = None
-            self.blank = None
-            self.brightness = None
-            self.color_value = None
-            self.contrast = None
-            self.color_temperature = None
-            self.high_altitude = None
-            self.lamp_mode = None
-            self.sharpness = None
+            for _, attribute, _ in _UPDATE_COMMANDS_POWERED_ON:
+                setattr(self, attribute, None)
 
             self.video_source = None
 
@@ -1281,69 +1609,28 @@ class BenQProjector(ABC):
             self.volume = None
         elif self.power_status in [self.POWERSTATUS_POWERINGON, self.POWERSTATUS_ON]:
             # Commands which only work when powered on
-            if self.supports_command("3d"):
-                self.threed_mode = await self.send_command("3d")
-                logger.debug("3D: %s", self.threed_mode)
-
-            if self.supports_command("appmod"):
-                self.picture_mode = await self.send_command("appmod")
-                logger.debug("Picture mode: %s", self.picture_mode)
-
-            if self.supports_command("asp"):
-                self.aspect_ratio = await self.send_command("asp")
-                logger.debug("Aspect ratio: %s", self.aspect_ratio)
-
-            if self.supports_command("bc"):
-                self.brilliant_color = await self.send_command("bc") == "on"
-                logger.debug("Brilliant color: %s", self.brilliant_color)
-
-            if self.supports_command("blank"):
-                self.blank = await self.send_command("blank") == "on"
-                logger.debug("Blank: %s", self.blank)
-
-            if self.supports_command("bri"):
-                response = await self.send_command("bri")
-                if response is not None:
-                    self.brightness = int(response)
-                    logger.debug("Brightness: %s", self.brightness)
-
-            if self.supports_command("color"):
-                response = await self.send_command("color")
-                if response is not None:
-                    self.color_value = int(response)
-                    logger.debug("Color value: %s", self.color_value)
-
-            if self.supports_command("con"):
-                response = await self.send_command("con")
-                if response is not None:
-                    self.contrast = int(response)
-                    logger.debug("Contrast: %s", self.contrast)
-
-            if self.supports_command("ct"):
-                self.color_temperature = await self.send_command("ct")
-                logger.debug("Color temperature: %s", self.color_temperature)
-
-            if self.supports_command("highaltitude"):
-                self.high_altitude = await self.send_command("highaltitude") == "on"
-                logger.debug("High altitude: %s", self.high_altitude)
-
-            if self.supports_command("lampm"):
-                self.lamp_mode = await self.send_command("lampm")
-                logger.debug("Lamp mode: %s", self.lamp_mode)
-
-            if self.supports_command("qas"):
-                self.quick_auto_search = await self.send_command("qas") == "on"
-                logger.debug("Quick auto search: %s", self.quick_auto_search)
-
-            if self.supports_command("sharp"):
-                self.sharpness = await self.send_command("sharp")
-                logger.debug("Sharpness: %s", self.sharpness)
+            await self._update_state(_UPDATE_COMMANDS_POWERED_ON)
 
             await self.update_video_source()
             await self.update_volume()
 
         return True
 
+    async def _query_power(self) -> str | None:
+        """
+        Returns the power state response of the projector.
+
+        The power state read by update_power() is reused if it's still fresh, saving a round
+        trip when the projector is turned on or off right after being polled.
+        """
+        if (
+            self._power_response is not None
+            and time.monotonic() - self._power_response_time < _POWER_STATE_TTL
+        ):
+            return self._power_response
+
+        return await self._send_command(BenQCommand.query("pow"))
+
     async def turn_on(self) -> bool:
         """
         Turn the projector on.
@@ -1353,7 +1640,7 @@ class BenQProjector(ABC):
         # Check the actual power state of the projector.
         response = None
         try:
-            response = await self._send_command(BenQCommand("pow"))
+            response = await self._query_power()
             if response is None:
                 logger.error("Failed to retrieve projector power state.")
         except BenQBlockedItemError as ex:
@@ -1369,7 +1656,7 @@ class BenQProjector(ABC):
             # The projector is already on.
             if (
                 self.power_status == self.POWERSTATUS_POWERINGON
-                and (time.time() - self._power_timestamp) <= self._poweron_time
+                and (time.monotonic() - self._power_timestamp) <= self._poweron_time
             ):
                 logger.debug("Projector still powering on")
             else:
@@ -1383,7 +1670,7 @@ class BenQProjector(ABC):
             # The projector is off, calculate if the power off time has already passed
             if (
                 self.power_status == self.POWERSTATUS_POWERINGOFF
-                and (time.time() - self._power_timestamp) <= self._poweroff_time
+                and (time.monotonic() - self._power_timestamp) <= self._poweroff_time
             ):
                 logger.warning("Projector still powering off")
                 return False
@@ -1393,19 +1680,22 @@ class BenQProjector(ABC):
             # Continue powering on the projector.
             logger.info("Turning on projector")
             try:
-                response = await self._send_command(BenQCommand("pow", "on"))
-                if response == "on":
-                    self.power_status = self.POWERSTATUS_POWERINGON
-                    self._power_timestamp = time.time()
-
-                    return True
+                response = await self._send_command(BenQCommand.shared("pow", "on"))
             except BenQBlockedItemError as ex:
                 logger.error(
                     "Failed to turn on projector, is projector already powering on or off? %s",
                     ex,
                 )
+                return False
             except BenQProjectorError as ex:
-                pass
+                logger.error("Failed to turn on projector: %s", ex)
+                return False
+
+            if response == "on":
+                self.power_status = self.POWERSTATUS_POWERINGON
+                self._power_timestamp = time.monotonic()
+
+                return True
 
             logger.error("Failed to turn on projector, response: %s", response)
 
@@ -1420,7 +1710,7 @@ class BenQProjector(ABC):
         # Check the actual power state of the projector.
         response = None
         try:
-            response = await self._send_command(BenQCommand("pow"))
+            response = await self._query_power()
             if response is None:
                 logger.error("Failed to retrieve projector power state.")
         except BenQBlockedItemError as ex:
@@ -1436,7 +1726,7 @@ class BenQProjector(ABC):
             # The projector is already off.
             if (
                 self.power_status == self.POWERSTATUS_POWERINGOFF
-                and (time.time() - self._power_timestamp) <= self._poweroff_time
+                and (time.monotonic() - self._power_timestamp) <= self._poweroff_time
             ):
                 logger.debug("Projector still powering off")
             else:
@@ -1450,7 +1740,7 @@ class BenQProjector(ABC):
             # The projector is on, calculate if the power on time has already passed
             if (
                 self.power_status == self.POWERSTATUS_POWERINGON
-                and (time.time() - self._power_timestamp) <= self._poweron_time
+                and (time.monotonic() - self._power_timestamp) <= self._poweron_time
             ):
                 logger.warning("Projector still powering on")
                 return False
@@ -1460,19 +1750,22 @@ class BenQProjector(ABC):
             # Continue powering off the projector.
             logger.info("Turning off projector")
             try:
-                response = await self._send_command(BenQCommand("pow", "off"))
-                if response == "off":
-                    self.power_status = self.POWERSTATUS_POWERINGOFF
-                    self._power_timestamp = time.time()
-
-                    return True
+                response = await self._send_command(BenQCommand.shared("pow", "off"))
             except BenQBlockedItemError as ex:
                 logger.error(
                     "Failed to turn off projector, is projector already powering on or off? %s",
                     ex,
                 )
+                return False
             except BenQProjectorError as ex:
-                pass
+                logger.error("Failed to turn off projector: %s", ex)
+                return False
+
+            if response == "off":
+                self.power_status = self.POWERSTATUS_POWERINGOFF
+                self._power_timestamp = time.monotonic()
+
+                return True
 
             logger.error("Failed to turn off projector, response: %s", response)
 
@@ -1505,8 +1798,9 @@ class BenQProjector(ABC):
         Increase volume.
         """
         if self.volume is None:
-            self.update_volume()
-        elif self.volume >= 20:  # Can't go higher than 20
+            await self.update_volume()
+        # Can't go higher than 20, the refreshed volume is checked as well
+        if self.volume is None or self.volume >= 20:
             return False
 
         if await self.send_command("vol", "+") == "+":
@@ -1520,8 +1814,9 @@ class BenQProjector(ABC):
         Decrease volume.
         """
         if self.volume is None:
-            self.update_volume()
-        elif self.volume <= 0:  # Can't go lower than 0
+            await self.update_volume()
+        # Can't go lower than 0, the refreshed volume is checked as well
+        if self.volume is None or self.volume <= 0:
             return False
 
         if await self.send_command("vol", "-") == "-":
@@ -1534,6 +1829,12 @@ class BenQProjector(ABC):
         """
         Set volume to a given level.
         """
+        if self.volume is None:
+            await self.update_volume()
+            if self.volume is None:
+                logger.error("Unable to retrieve the current volume")
+                return False
+
         if self.volume == level:
             return True
 
@@ -1542,6 +1843,7 @@ class BenQProjector(ABC):
             try:
                 if await self._send_command(BenQCommand("vol", level)) == str(level):
                     logger.debug("Successfully set volume withouth increments")
+                    self.volume = level
                     return True
             except BenQUnsupportedItemError:
                 logger.debug("Need increments to set volume")
@@ -8,10 +8,13 @@ Created on 5 Dec 2022
 @author: rogier
 """
 
+import copy
+import pickle
 import unittest
 
 from benqprojector.benqprojector import (
     BenQBlockedItemError,
+    BenQCommand,
     BenQEmptyResponseError,
     BenQIllegalFormatError,
     BenQInvallidResponseError,
@@ -39,6 +42,44 @@ class Test(unittest.TestCase):
     def testBenQInvallidResponseError(self):
         BenQInvallidResponseError()
 
+    def testBenQProjectorErrorStr(self):
+        error = BenQBlockedItemError(BenQCommand("pow", "on"))
+        self.assertEqual(str(error), "Block item for command 'pow' and action 'on'")
+
+        error = BenQInvallidResponseError(BenQCommand("pow"), "*pow=#")
+        self.assertEqual(
+            str(error),
+            "Invalid response for command 'pow' and action '?'. response: *pow=#",
+        )
+
+    def testBenQProjectorErrorCommandSetter(self):
+        error = BenQUnsupportedItemError()
+        error.command = BenQCommand("pow")
+        self.assertEqual(
+            str(error), "Unsupported item for command 'pow' and action '?'"
+        )
+        self.assertIs(error.args[0], error.command)
+
+    def testBenQProjectorErrorCopy(self):
+        error = BenQInvallidResponseError(BenQCommand("pow"), "*pow=#")
+        error_copy = copy.copy(error)
+        self.assertEqual(error_copy.command.raw_command, "*pow=?#")
+        self.assertEqual(error_copy.response, "*pow=#")
+        self.assertEqual(str(error_copy), str(error))
+
+    def testBenQProjectorErrorPickle(self):
+        error = BenQBlockedItemError()
+        error.command = BenQCommand("pow", "on")
+        error_copy = pickle.loads(pickle.dumps(error))
+        self.assertIsInstance(error_copy, BenQBlockedItemError)
+        self.assertEqual(error_copy.command.raw_command, "*pow=on#")
+        self.assertEqual(str(error_copy), str(error))
+
+        error = BenQInvallidResponseError(BenQCommand("pow"), "*pow=#")
+        error_copy = pickle.loads(pickle.dumps(error))
+        self.assertEqual(error_copy.response, "*pow=#")
+        self.assertEqual(str(error_copy), str(error))
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testBenQProjectorError']
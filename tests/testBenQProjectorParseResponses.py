@@ -16,6 +16,7 @@ from benqprojector.benqprojector import (
     BenQBlockedItemError,
     BenQCommand,
     BenQIllegalFormatError,
+    BenQInvallidResponseError,
     BenQProjector,
     BenQUnsupportedItemError,
 )
@@ -96,11 +97,44 @@ class Test(unittest.TestCase):
             "*Block item#",
         )
 
+    def test_parse_response_illegal_format_uppercase(self):
+        # Error responses are also detected when the response is not lowercased
+        self.assertRaises(
+            BenQIllegalFormatError,
+            self._projector._parse_response,
+            BenQCommand("modelname"),
+            "*Illegal format#",
+            False,
+        )
+
     def test_parse_response_up(self):
         # Some commands don't take any actions, like the up command for navigating the menu.
         response = self._projector._parse_response(BenQCommand("up", None), "*UP#")
         self.assertEqual("up", response)
 
+    def test_parse_response_invalid_command(self):
+        self.assertRaises(
+            BenQInvallidResponseError,
+            self._projector._parse_response,
+            BenQCommand("pow"),
+            "*vol=5#",
+        )
+
+    def test_parse_response_strict_validation(self):
+        projector = BenQProjector(SERIAL_PORT, strict_validation=True)
+        response = projector._parse_response(BenQCommand("pow"), "*POW=ON#")
+        self.assertEqual("on", response)
+        # Strict validation requires the response to start with * and end with #
+        self.assertRaises(
+            BenQInvallidResponseError,
+            projector._parse_response,
+            BenQCommand("bri"),
+            "*bri= 51",
+        )
+        # Except for the model name which some projectors return without the command
+        response = projector._parse_response(BenQCommand("modelname"), "W700", False)
+        self.assertEqual("W700", response)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,94 @@
+# pylint: disable=R0801
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+"""
+Created on 16 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+import unittest
+
+from benqprojector import BenQProjectorSerial
+
+logger = logging.getLogger(__name__)
+
+SERIAL_PORT = "/dev/tty.usbserial-10"
+BAUD_RATE = 115200
+
+RESPONSES = {
+    "pow": "on",
+    "directpower": "off",
+    "ltim": "1383",
+    "ltim2": "12",
+    "pp": "ft",
+    "bri": "51",
+    "con": "50",
+    "color": "48",
+    "ct": "normal",
+    "sour": "hdmi",
+    "mute": "off",
+    "vol": "10",
+}
+
+
+class Test(unittest.IsolatedAsyncioTestCase):
+    _projector = None
+
+    async def asyncSetUp(self):
+        self._projector = BenQProjectorSerial(SERIAL_PORT, BAUD_RATE)
+        # Don't need to connect to the projector, the responses are stubbed
+        self._projector._send_command = self._send_command
+        self._responses = dict(RESPONSES)
+        self._commands = []
+
+    async def _send_command(
+        self, command, check_supported=True, lowercase_response=True
+    ):  # pylint: disable=unused-argument
+        self._commands.append((command.command, command.action))
+        if command.action == "?":
+            return self._responses.get(command.command)
+        return command.action
+
+    async def test_update_skips_invalid_number(self):
+        self._responses["bri"] = "abc"
+
+        self.assertTrue(await self._projector.update())
+        self.assertIsNone(self._projector.brightness)
+        # The state after the invalid response is still updated
+        self.assertEqual(50, self._projector.contrast)
+        self.assertEqual(48, self._projector.color_value)
+        self.assertEqual("hdmi", self._projector.video_source)
+        self.assertEqual(10, self._projector.volume)
+
+    async def test_update_skips_fresh_lamp_time(self):
+        await self._projector.update()
+        self.assertEqual(1383, self._projector.lamp_time)
+
+        self._responses["ltim"] = "1384"
+        self._commands.clear()
+        await self._projector.update()
+
+        self.assertNotIn(("ltim", "?"), self._commands)
+        self.assertEqual(1383, self._projector.lamp_time)
+        # Fast changing state is still queried
+        self.assertIn(("bri", "?"), self._commands)
+
+    async def test_turn_on_reuses_fresh_power_state(self):
+        self._responses["pow"] = "off"
+        await self._projector.update_power()
+
+        self._commands.clear()
+        self.assertTrue(await self._projector.turn_on())
+
+        self.assertEqual([("pow", "on")], self._commands)
+        self.assertEqual(
+            self._projector.POWERSTATUS_POWERINGON, self._projector.power_status
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()